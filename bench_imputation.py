@@ -0,0 +1,59 @@
+# bench_imputation.py
+
+# Times imputation.fit_imputer / apply_imputation on a synthetic Titanic-shaped batch.
+# Usage: python bench_imputation.py --rows 20000000
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import imputation
+
+
+def make_batch(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    titles = pd.Categorical.from_codes(
+        rng.choice(5, size=rows, p=[0.58, 0.2, 0.14, 0.05, 0.03]),
+        categories=['Mr', 'Miss', 'Mrs', 'Master', 'Rare'],
+    )
+    age = rng.normal(30, 14, size=rows).clip(0.4, 80)
+    age[rng.random(rows) < 0.2] = np.nan
+    embarked = pd.Categorical.from_codes(
+        rng.choice(3, size=rows, p=[0.19, 0.09, 0.72]),
+        categories=['C', 'Q', 'S'],
+    )
+    embarked[rng.random(rows) < 0.002] = np.nan
+    return pd.DataFrame({
+        'Title': titles,
+        'Pclass': rng.choice([1, 2, 3], size=rows, p=[0.24, 0.21, 0.55]),
+        'Fare': rng.lognormal(2.9, 1.0, size=rows),
+        'Age': age,
+        'Embarked': embarked,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    data = make_batch(args.rows)
+
+    start = time.perf_counter()
+    params = imputation.fit_imputer(data)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    filled = imputation.apply_imputation(data, params)
+    apply_seconds = time.perf_counter() - start
+
+    print(f"rows:  {args.rows:,}")
+    print(f"fit:   {fit_seconds:.2f}s ({args.rows / fit_seconds:,.0f} rows/s)")
+    print(f"apply: {apply_seconds:.2f}s ({args.rows / apply_seconds:,.0f} rows/s)")
+    print(f"missing after apply: {int(filled[list(imputation.SPECS)].isnull().sum().sum())}")
+
+
+if __name__ == "__main__":
+    main()
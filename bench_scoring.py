@@ -0,0 +1,49 @@
+# bench_scoring.py
+
+# Measures survival-model scoring throughput, single-process and with a process pool.
+# Usage: python bench_scoring.py --rows 10000000 --processes 4
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+import pandas as pd
+
+import model
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--processes', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    survival_model = model.load_or_train_model("titanic_cleaned.csv")
+    data = pd.read_csv("titanic_cleaned.csv")[model.FEATURES]
+    batch = data.sample(args.rows, replace=True, random_state=0).reset_index(drop=True)
+
+    start = time.perf_counter()
+    model.score(batch, survival_model)
+    single_seconds = time.perf_counter() - start
+
+    # Pool startup is a one-off cost, so it is timed apart from scoring.
+    start = time.perf_counter()
+    pool = Pool(args.processes)
+    pool.map(abs, range(args.processes))
+    startup_seconds = time.perf_counter() - start
+
+    with pool:
+        start = time.perf_counter()
+        model.score_parallel(batch, survival_model, pool)
+        parallel_seconds = time.perf_counter() - start
+
+    print(f"rows:           {args.rows:,}")
+    print(f"single-process: {single_seconds:.2f}s ({args.rows / single_seconds:,.0f} rows/s)")
+    print(f"multi-process:  {parallel_seconds:.2f}s ({args.rows / parallel_seconds:,.0f} rows/s, "
+          f"{args.processes} processes)")
+    print(f"pool startup:   {startup_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# charts.py
+
+# Chart helpers shared by the pages. Aggregation happens here with pandas/numpy so
+# only a small summary table is sent to the browser, where Vega-Lite renders it and
+# handles hover, zoom and legend highlighting without a Streamlit rerun.
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+SCHEME = "viridis"
+HEIGHT = 350
+SURVIVED_LABELS = "datum.label == '1' ? 'Yes' : 'No'"
+
+
+def _legend(field, title=None):
+    if field == 'Survived':
+        return alt.Legend(title=title or field, labelExpr=SURVIVED_LABELS)
+    return alt.Legend(title=title or field)
+
+
+def _color(field, title=None):
+    return alt.Color(f'{field}:N', scale=alt.Scale(scheme=SCHEME), legend=_legend(field, title))
+
+
+def _highlight(field):
+    # Clicking a legend entry fades the other groups; handled entirely client-side.
+    return alt.selection_point(fields=[field], bind='legend')
+
+
+def _opacity(selection):
+    return alt.condition(selection, alt.value(1.0), alt.value(0.2))
+
+
+def aggregate_counts(data, x, hue=None):
+    keys = [x] if hue is None else [x, hue]
+    return data.groupby(keys).size().reset_index(name='Count')
+
+
+def aggregate_histogram(values, bins=30):
+    values = pd.Series(values).dropna()
+    counts, edges = np.histogram(values, bins=bins)
+    return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'Count': counts})
+
+
+def aggregate_boxplot(data, x, y):
+    values = data[[x, y]].dropna()
+    if values.empty:
+        return pd.DataFrame(columns=[x, 'q1', 'median', 'q3', 'lower', 'upper']), values
+    stats = values.groupby(x)[y].quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ['q1', 'median', 'q3']
+    iqr = stats['q3'] - stats['q1']
+    inside = values[y].between(
+        values[x].map(stats['q1'] - 1.5 * iqr),
+        values[x].map(stats['q3'] + 1.5 * iqr),
+    )
+    whiskers = values[inside].groupby(x)[y].agg(['min', 'max'])
+    stats['lower'] = whiskers['min']
+    stats['upper'] = whiskers['max']
+    return stats.reset_index(), values[~inside]
+
+
+def aggregate_density(data, x, y, points=100):
+    values = data[[x, y]].dropna()
+    if values.empty:
+        return pd.DataFrame(columns=[x, y, 'Density'])
+    grid = np.linspace(values[y].min(), values[y].max(), points)
+    frames = []
+    for group, sample in values.groupby(x)[y]:
+        sample = sample.to_numpy(dtype=float)
+        bandwidth = sample.std() * len(sample) ** (-1 / 5)  # Scott's rule
+        if len(sample) < 2 or bandwidth == 0:
+            continue
+        z = (grid[:, None] - sample[None, :]) / bandwidth
+        density = np.exp(-0.5 * z ** 2).sum(axis=1) / (len(sample) * bandwidth * np.sqrt(2 * np.pi))
+        frames.append(pd.DataFrame({x: group, y: grid, 'Density': density}))
+    if not frames:
+        return pd.DataFrame(columns=[x, y, 'Density'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def aggregate_histogram_density(values, hist):
+    # KDE grid scaled from density to counts per bin, so it overlays the histogram.
+    values = pd.Series(values, name='value').dropna()
+    density = aggregate_density(values.to_frame().assign(group=0), 'group', 'value')
+    bin_width = (hist['bin_end'] - hist['bin_start']).iloc[0] if len(hist) else 0
+    density['Count'] = density['Density'] * len(values) * bin_width
+    return density[['value', 'Count']]
+
+
+def count_chart(data, x, hue=None, title="", x_title=None, sort=None):
+    counts = aggregate_counts(data, x, hue)
+    base = alt.Chart(counts, title=title).encode(
+        x=alt.X(f'{x}:N', title=x_title or x, sort=sort, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y('Count:Q', title="Count"),
+    )
+    if hue is None:
+        bars = base.mark_bar().encode(
+            color=alt.Color(f'{x}:N', scale=alt.Scale(scheme=SCHEME), legend=None),
+            tooltip=[x, 'Count'],
+        )
+        labels = base.mark_text(dy=-6).encode(text='Count:Q')
+        return (bars + labels).properties(height=HEIGHT)
+
+    selection = _highlight(hue)
+    bars = base.mark_bar().encode(
+        xOffset=alt.XOffset(f'{hue}:N'),
+        color=_color(hue),
+        opacity=_opacity(selection),
+        tooltip=[x, hue, 'Count'],
+    ).add_params(selection)
+    labels = base.mark_text(dy=-6).encode(
+        xOffset=alt.XOffset(f'{hue}:N'),
+        text='Count:Q',
+        opacity=_opacity(selection),
+    )
+    return (bars + labels).properties(height=HEIGHT)
+
+
+def histogram_chart(values, title="", x_title=None, bins=30, color="skyblue", kde=True):
+    hist = aggregate_histogram(values, bins=bins)
+    bars = alt.Chart(hist, title=title).mark_bar(color=color).encode(
+        x=alt.X('bin_start:Q', bin='binned', title=x_title),
+        x2='bin_end:Q',
+        y=alt.Y('Count:Q', title="Count"),
+        tooltip=['bin_start', 'bin_end', 'Count'],
+    ).interactive(bind_y=False)
+    if not kde:
+        return bars.properties(height=HEIGHT)
+    density = aggregate_histogram_density(values, hist)
+    curve = alt.Chart(density).mark_line(color=color).encode(
+        x='value:Q',
+        y='Count:Q',
+    )
+    return (bars + curve).properties(height=HEIGHT)
+
+
+def box_chart(data, x, y, title="", x_title=None, y_title=None):
+    stats, outliers = aggregate_boxplot(data, x, y)
+    selection = _highlight(x)
+    x_enc = alt.X(f'{x}:N', title=x_title or x, axis=alt.Axis(labelAngle=0))
+    base = alt.Chart(stats, title=title).encode(x=x_enc)
+    whiskers = base.mark_rule().encode(
+        y=alt.Y('lower:Q', title=y_title or y),
+        y2='upper:Q',
+        opacity=_opacity(selection),
+    )
+    boxes = base.mark_bar(size=40).encode(
+        y='q1:Q',
+        y2='q3:Q',
+        color=_color(x, x_title),
+        opacity=_opacity(selection),
+        tooltip=[x, 'lower', 'q1', 'median', 'q3', 'upper'],
+    ).add_params(selection)
+    medians = base.mark_tick(color='white', size=40).encode(y='median:Q', opacity=_opacity(selection))
+    points = alt.Chart(outliers).mark_point().encode(
+        x=x_enc,
+        y=f'{y}:Q',
+        color=_color(x, x_title),
+        opacity=_opacity(selection),
+        tooltip=[x, y],
+    )
+    return alt.layer(whiskers, boxes, medians, points).properties(height=HEIGHT)
+
+
+def violin_chart(data, x, y, title="", x_title=None, y_title=None):
+    density = aggregate_density(data, x, y)
+    selection = _highlight(x)
+    return alt.Chart(density).mark_area(orient='horizontal').encode(
+        y=alt.Y(f'{y}:Q', title=y_title or y),
+        x=alt.X('Density:Q', stack='center', impute=None, title=None,
+                axis=alt.Axis(labels=False, values=[0], grid=False, ticks=True)),
+        color=_color(x, x_title),
+        opacity=_opacity(selection),
+    ).add_params(selection).properties(width=120, height=HEIGHT).facet(
+        column=alt.Column(f'{x}:N', title=x_title or x,
+                          header=alt.Header(labelOrient='bottom', titleOrient='bottom')),
+        title=title,
+    )
+
+
+def scatter_chart(data, x, y, hue, title="", x_title=None, y_title=None):
+    points = data[[x, y, hue]].dropna()
+    selection = _highlight(hue)
+    return alt.Chart(points, title=title).mark_circle(size=40).encode(
+        x=alt.X(f'{x}:Q', title=x_title or x),
+        y=alt.Y(f'{y}:Q', title=y_title or y),
+        color=_color(hue),
+        opacity=_opacity(selection),
+        tooltip=[x, y, hue],
+    ).add_params(selection).properties(height=HEIGHT).interactive()
+
+
+def heatmap_chart(corr, title=""):
+    cells = corr.rename_axis('row').reset_index().melt(
+        id_vars='row', var_name='column', value_name='Correlation'
+    )
+    base = alt.Chart(cells, title=title).encode(
+        x=alt.X('column:N', title=None, sort=list(corr.columns)),
+        y=alt.Y('row:N', title=None, sort=list(corr.index)),
+    )
+    rects = base.mark_rect().encode(
+        color=alt.Color('Correlation:Q', scale=alt.Scale(scheme='redblue', domain=[-1, 1], reverse=True)),
+        tooltip=['row', 'column', alt.Tooltip('Correlation:Q', format='.2f')],
+    )
+    labels = base.mark_text(fontSize=11).encode(text=alt.Text('Correlation:Q', format='.2f'))
+    return (rects + labels).properties(height=500)
+
+
+def interval_chart(summary, x, title="", x_title=None):
+    base = alt.Chart(summary, title=title).encode(
+        x=alt.X(f'{x}:N', title=x_title or x, axis=alt.Axis(labelAngle=0)),
+    )
+    tooltip = [x, 'Passengers', 'Survivors',
+               alt.Tooltip('Survival_Rate:Q', format='.1%'),
+               alt.Tooltip('Lower:Q', format='.1%'),
+               alt.Tooltip('Upper:Q', format='.1%'),
+               'Method']
+    bars = base.mark_rule(strokeWidth=2).encode(
+        y=alt.Y('Lower:Q', title="Survival Rate", axis=alt.Axis(format='%'), scale=alt.Scale(domain=[0, 1])),
+        y2='Upper:Q',
+        tooltip=tooltip,
+    )
+    points = base.mark_circle(size=80).encode(
+        y='Survival_Rate:Q',
+        color=alt.Color(f'{x}:N', scale=alt.Scale(scheme=SCHEME), legend=None),
+        shape=alt.Shape('Method:N', title="Interval"),
+        tooltip=tooltip,
+    )
+    return (bars + points).properties(height=HEIGHT)
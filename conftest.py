@@ -0,0 +1,3 @@
+# conftest.py
+
+# Lets the tests import the top-level modules (imputation, model, ...) directly.
@@ -0,0 +1,99 @@
+# imputation.py
+
+# Group-conditional imputation. fit_imputer computes every group statistic in a
+# single groupby pass and returns a plain dict that can be saved as JSON;
+# apply_imputation fills a new batch with one merge per column, no per-group loops.
+
+import json
+
+import numpy as np
+import pandas as pd
+
+PARAMS_PATH = "imputation_params.json"
+TITLE_PATTERN = r' ([A-Za-z]+)\.'
+FARE_BANDS = 4
+
+SPECS = {
+    'Age': {'by': ['Title', 'Pclass'], 'how': 'median'},
+    'Embarked': {'by': ['Pclass', 'Fare_Band'], 'how': 'mode'},
+}
+
+
+def fare_band_edges(fare, bands=FARE_BANDS):
+    # Inner quantile edges only, so out-of-range fares in later batches still land in a band.
+    edges = fare.dropna().quantile(np.linspace(0, 1, bands + 1)).unique()
+    return edges[1:-1].tolist()
+
+
+def group_keys(data, fare_edges):
+    keys = pd.DataFrame(index=data.index)
+    if 'Title' in data.columns:
+        keys['Title'] = data['Title']
+    else:
+        keys['Title'] = data['Name'].str.extract(TITLE_PATTERN, expand=False)
+    keys['Pclass'] = data['Pclass']
+    fare = data['Fare'].to_numpy(dtype=float)
+    keys['Fare_Band'] = np.where(np.isnan(fare), -1, np.searchsorted(fare_edges, fare, side='right'))
+    return keys
+
+
+def _group_statistic(frame, target, by, how):
+    if how == 'median':
+        return frame.groupby(by, observed=True)[target].median().dropna().reset_index()
+    counts = (
+        frame.dropna(subset=[target])
+             .groupby(by + [target], observed=True)
+             .size()
+             .reset_index(name='count')
+             .sort_values('count', ascending=False, kind='stable')
+    )
+    return counts.drop_duplicates(subset=by).drop(columns='count')
+
+
+def fit_imputer(data):
+    fare_edges = fare_band_edges(data['Fare'])
+    frame = pd.concat([group_keys(data, fare_edges), data[list(SPECS)]], axis=1)
+    params = {'fare_edges': fare_edges, 'columns': {}}
+    for target, spec in SPECS.items():
+        table = _group_statistic(frame, target, spec['by'], spec['how'])
+        if spec['how'] == 'median':
+            fallback = float(frame[target].median())
+        else:
+            fallback = frame[target].mode()[0]
+        params['columns'][target] = {
+            'by': spec['by'],
+            'how': spec['how'],
+            'fallback': fallback,
+            'table': table.to_dict(orient='records'),
+        }
+    return params
+
+
+def apply_imputation(data, params):
+    data = data.copy()
+    keys = group_keys(data, params['fare_edges'])
+    for target, spec in params['columns'].items():
+        by = spec['by']
+        table = pd.DataFrame.from_records(spec['table'], columns=by + [target])
+        # Casting to the batch's key dtypes turns fitted keys outside a categorical's
+        # categories into NaN; drop them so they cannot match the batch's NaN keys.
+        table = table.astype(keys[by].dtypes.to_dict()).dropna(subset=by).set_index(by)
+        table = table[~table.index.duplicated()]
+        filled = keys[by].join(table, on=by)[target].fillna(spec['fallback'])
+        data[target] = data[target].fillna(filled)
+    return data
+
+
+def statistics_table(params, target):
+    spec = params['columns'][target]
+    return pd.DataFrame.from_records(spec['table'], columns=spec['by'] + [target])
+
+
+def save_params(params, path=PARAMS_PATH):
+    with open(path, 'w') as f:
+        json.dump(params, f, indent=2)
+
+
+def load_params(path=PARAMS_PATH):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,106 @@
+# intervals.py
+
+# Confidence intervals for survival rates. Wilson intervals are computed for all
+# groups at once from groupby counts. Bootstrap resamples are drawn as an index
+# matrix (resamples x rows) and reduced with one mean per row; large groups are
+# split into chunks of resamples that run on a process pool. Groups too small or
+# too uniform for the bootstrap fall back to Wilson, recorded in the Method column.
+
+from contextlib import nullcontext
+from functools import partial
+from multiprocessing import Pool
+from statistics import NormalDist
+
+import numpy as np
+
+LEVEL = 0.95
+RESAMPLES = 2000
+CHUNK_CELLS = 10_000_000  # resamples x rows per chunk, bounds memory per worker
+POOL_MIN_ROWS = 50_000
+BOOTSTRAP_MIN_ROWS = 30
+
+
+def _z(level):
+    return NormalDist().inv_cdf((1 + level) / 2)
+
+
+def wilson_interval(successes, n, level=LEVEL):
+    successes = np.asarray(successes, dtype=float)
+    n = np.asarray(n, dtype=float)
+    z = _z(level)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        p = successes / n
+        denominator = 1 + z ** 2 / n
+        centre = (p + z ** 2 / (2 * n)) / denominator
+        margin = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return centre - margin, centre + margin
+
+
+def _bootstrap_means(seed, resamples, values):
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(values), size=(resamples, len(values)))
+    return values[idx].mean(axis=1)
+
+
+def bootstrap_interval(values, level=LEVEL, resamples=RESAMPLES, seed=0, pool=None):
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return np.nan, np.nan
+    per_chunk = max(1, min(resamples, CHUNK_CELLS // len(values)))
+    sizes = [per_chunk] * (resamples // per_chunk)
+    if resamples % per_chunk:
+        sizes.append(resamples % per_chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    worker = partial(_bootstrap_means, values=values)
+    if pool is not None and len(values) >= POOL_MIN_ROWS and len(sizes) > 1:
+        parts = pool.starmap(worker, zip(seeds, sizes))
+    else:
+        parts = [worker(s, size) for s, size in zip(seeds, sizes)]
+
+    means = np.concatenate(parts)
+    alpha = (1 - level) / 2
+    lower, upper = np.quantile(means, [alpha, 1 - alpha])
+    return lower, upper
+
+
+def _bootstrap_or_wilson(survived, level, pool):
+    # The percentile bootstrap collapses to a zero-width interval for tiny groups and
+    # for groups where everyone (or nobody) survived, so those get Wilson instead.
+    n, survivors = len(survived), int(survived.sum())
+    if n < BOOTSTRAP_MIN_ROWS or survivors in (0, n):
+        lower, upper = wilson_interval(survivors, n, level)
+        return float(lower), float(upper), "Wilson"
+    lower, upper = bootstrap_interval(survived, level=level, pool=pool)
+    return float(lower), float(upper), "Bootstrap"
+
+
+def _pool_for(sizes, processes):
+    return Pool(processes) if max(sizes, default=0) >= POOL_MIN_ROWS else nullcontext()
+
+
+def group_intervals(data, by, method="Wilson", level=LEVEL, processes=None):
+    grouped = data.groupby(by)['Survived']
+    summary = grouped.agg(Passengers='count', Survivors='sum')
+    summary['Survival_Rate'] = summary['Survivors'] / summary['Passengers']
+    if method == "Wilson":
+        summary['Lower'], summary['Upper'] = wilson_interval(summary['Survivors'], summary['Passengers'], level)
+        summary['Method'] = "Wilson"
+    else:
+        with _pool_for(summary['Passengers'], processes) as pool:
+            bounds = {
+                key: _bootstrap_or_wilson(group.dropna().to_numpy(), level, pool)
+                for key, group in grouped
+            }
+        for column, position in (('Lower', 0), ('Upper', 1), ('Method', 2)):
+            summary[column] = [bounds[key][position] for key in summary.index]
+    return summary.reset_index()
+
+
+def overall_interval(data, method="Wilson", level=LEVEL, processes=None):
+    survived = data['Survived'].dropna().to_numpy()
+    if method == "Wilson":
+        lower, upper = wilson_interval(survived.sum(), len(survived), level)
+        return float(lower), float(upper), "Wilson"
+    with _pool_for([len(survived)], processes) as pool:
+        return _bootstrap_or_wilson(survived, level, pool)
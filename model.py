@@ -0,0 +1,127 @@
+# model.py
+
+# Logistic regression survival model on the cleaned features. Training uses
+# Newton-Raphson on standardized features; scoring is a single matrix-vector
+# product, optionally split across a process pool over shared memory for large
+# batches. The fitted model is a plain dict saved as JSON and tagged with the
+# dataset version it was trained on, so it is only retrained when
+# titanic_cleaned.csv changes.
+
+import hashlib
+import json
+import os
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+FEATURES = ['Pclass', 'Sex_Code', 'Age', 'Fare', 'Embarked_Code', 'Family_Size']
+MODEL_PATH = "survival_model.json"
+
+
+def dataset_version(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+
+def _standardize(X, model):
+    mean = np.asarray(model['mean'])
+    X = np.where(np.isnan(X), mean, X)
+    return (X - mean) / np.asarray(model['scale'])
+
+
+def train_model(data, l2=1.0, iterations=25):
+    X = data[FEATURES].to_numpy(dtype=float)
+    y = data['Survived'].to_numpy(dtype=float)
+    mean = np.nanmean(X, axis=0)
+    scale = np.nanstd(X, axis=0)
+    scale[scale == 0] = 1.0
+    model = {'features': FEATURES, 'mean': mean.tolist(), 'scale': scale.tolist()}
+
+    Z = np.column_stack([np.ones(len(X)), _standardize(X, model)])
+    penalty = np.full(Z.shape[1], l2)
+    penalty[0] = 0.0  # leave the intercept unregularized
+    w = np.zeros(Z.shape[1])
+    for _ in range(iterations):
+        p = _sigmoid(Z @ w)
+        gradient = Z.T @ (p - y) + penalty * w
+        hessian = (Z * (p * (1 - p))[:, None]).T @ Z + np.diag(penalty)
+        step = np.linalg.solve(hessian, gradient)
+        w -= step
+        if np.abs(step).max() < 1e-8:
+            break
+
+    p = _sigmoid(Z @ w)
+    model['intercept'] = float(w[0])
+    model['coef'] = w[1:].tolist()
+    model['train_accuracy'] = float(((p >= 0.5) == (y == 1)).mean())
+    return model
+
+
+def score_array(X, model):
+    Z = _standardize(X, model)
+    return _sigmoid(Z @ np.asarray(model['coef']) + model['intercept'])
+
+
+def score(data, model):
+    return score_array(data[model['features']].to_numpy(dtype=float), model)
+
+
+def _score_shared(bounds, model, names, shape):
+    start, stop = bounds
+    features = shared_memory.SharedMemory(name=names[0])
+    scores = shared_memory.SharedMemory(name=names[1])
+    X = np.ndarray(shape, dtype=np.float64, buffer=features.buf)
+    out = np.ndarray(shape[:1], dtype=np.float64, buffer=scores.buf)
+    out[start:stop] = score_array(X[start:stop], model)
+    del X, out
+    features.close()
+    scores.close()
+
+
+def score_parallel(data, model, pool, chunks=None):
+    # Features and scores live in shared memory; workers only receive (start, stop)
+    # row bounds, so nothing proportional to the batch is pickled either way.
+    shape = (len(data), len(model['features']))
+    features = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    scores = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * 8))
+    try:
+        X = np.ndarray(shape, dtype=np.float64, buffer=features.buf)
+        for j, column in enumerate(model['features']):
+            X[:, j] = data[column].to_numpy(dtype=float)
+        edges = np.linspace(0, shape[0], (chunks or os.cpu_count() * 4) + 1).astype(int)
+        worker = partial(_score_shared, model=model, names=(features.name, scores.name), shape=shape)
+        pool.map(worker, zip(edges[:-1].tolist(), edges[1:].tolist()))
+        out = np.ndarray(shape[:1], dtype=np.float64, buffer=scores.buf)
+        return out.copy()
+    finally:
+        X = out = None
+        for block in (features, scores):
+            block.close()
+            block.unlink()
+
+
+def save_model(model, path=MODEL_PATH):
+    with open(path, 'w') as f:
+        json.dump(model, f, indent=2)
+
+
+def load_or_train_model(data_path, model_path=MODEL_PATH):
+    version = dataset_version(data_path)
+    if os.path.exists(model_path):
+        with open(model_path) as f:
+            model = json.load(f)
+        if model.get('dataset_version') == version:
+            return model
+    model = train_model(pd.read_csv(data_path))
+    model['dataset_version'] = version
+    save_model(model, model_path)
+    return model
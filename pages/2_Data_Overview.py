@@ -6,6 +6,8 @@ import io
 import seaborn as sns
 import matplotlib.pyplot as plt 
 
+import intervals
+
 st.set_page_config(page_title="Data Overview", layout="wide")
 
 @st.cache_data
@@ -35,6 +37,8 @@ with col4:
     if 'Survived' in df.columns:
         survival_rate = (df['Survived'].mean() * 100)
         st.metric("Survival Rate", f"{survival_rate:.2f}%")
+        lower, upper, _ = intervals.overall_interval(df)
+        st.caption(f"95% CI (Wilson): {lower * 100:.2f}% – {upper * 100:.2f}%")
     else:
         st.metric("Survival Rate", "N/A")
 
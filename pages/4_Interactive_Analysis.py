@@ -2,11 +2,17 @@
 
 import streamlit as st
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+
+import charts
+import intervals
+import model
 
 st.set_page_config(page_title="Interactive Analysis", layout="wide")
 
+@st.cache_data
+def load_model():
+    return model.load_or_train_model("titanic_cleaned.csv")
+
 @st.cache_data
 def load_data():
     data = pd.read_csv("titanic_cleaned.csv") 
@@ -20,6 +26,8 @@ def load_data():
     data['Family_Size'] = data['SibSp'] + data['Parch'] + 1
   
     data['Title'] = data['Name'].str.extract(' ([A-Za-z]+)\.', expand=False)
+
+    data['Predicted_Survival'] = model.score(data, load_model()).round(3)
     return data
 
 df = load_data()
@@ -63,27 +71,51 @@ with col6:
     family_max = int(df['Family_Size'].max())
     family_range = st.slider("Select Family Size", family_min, family_max, (family_min, family_max))
 
+col7, _, _ = st.columns(3)
+
+with col7:
+    predicted_range = st.slider("Select Predicted Survival Probability", 0.0, 1.0, (0.0, 1.0), step=0.05)
+    st.caption(f"Logistic regression on {', '.join(load_model()['features'])} "
+               f"(training accuracy {load_model()['train_accuracy']:.1%})")
+
 st.markdown("---")
 
-filtered_df = df.copy()
+def apply_filters(data, filters):
+    sex, pclass, embarked, age_range, fare_range, family_range, predicted_range = filters
+    filtered = data
 
-if selected_sex != "All":
-    filtered_df = filtered_df[filtered_df['Sex'] == selected_sex]
+    if sex != "All":
+        filtered = filtered[filtered['Sex'] == sex]
 
-if selected_pclass != "All":
-    filtered_df = filtered_df[filtered_df['Pclass'] == selected_pclass]
+    if pclass != "All":
+        filtered = filtered[filtered['Pclass'] == pclass]
 
-if selected_embarked != "All":
-    filtered_df = filtered_df[filtered_df['Embarked'] == selected_embarked]
+    if embarked != "All":
+        filtered = filtered[filtered['Embarked'] == embarked]
 
-filtered_df = filtered_df[
-    (filtered_df['Age'] >= age_range[0]) & 
-    (filtered_df['Age'] <= age_range[1]) & 
-    (filtered_df['Fare'] >= fare_range[0]) & 
-    (filtered_df['Fare'] <= fare_range[1]) &
-    (filtered_df['Family_Size'] >= family_range[0]) &
-    (filtered_df['Family_Size'] <= family_range[1])
-]
+    return filtered[
+        (filtered['Age'] >= age_range[0]) & 
+        (filtered['Age'] <= age_range[1]) & 
+        (filtered['Fare'] >= fare_range[0]) & 
+        (filtered['Fare'] <= fare_range[1]) &
+        (filtered['Family_Size'] >= family_range[0]) &
+        (filtered['Family_Size'] <= family_range[1]) &
+        (filtered['Predicted_Survival'] >= predicted_range[0]) &
+        (filtered['Predicted_Survival'] <= predicted_range[1])
+    ].copy()
+
+# Keyed on the filter selections rather than the filtered frame, so revisiting a
+# filter combination returns its intervals without hashing or resampling again.
+@st.cache_data
+def survival_intervals(filters, by, method):
+    return intervals.group_intervals(apply_filters(load_data(), filters), by, method)
+
+@st.cache_data
+def overall_survival_interval(filters, method):
+    return intervals.overall_interval(apply_filters(load_data(), filters), method)
+
+filters = (selected_sex, selected_pclass, selected_embarked, age_range, fare_range, family_range, predicted_range)
+filtered_df = apply_filters(df, filters)
 
 st.header("Filtered Data")
 st.write(f"Number of Passengers after Filtering: {filtered_df.shape[0]}")
@@ -91,6 +123,43 @@ st.dataframe(filtered_df, use_container_width=True)
 
 st.markdown("---")
 
+st.header("Survival Rate with Confidence Intervals")
+
+col_group, col_method = st.columns(2)
+
+with col_group:
+    interval_group = st.selectbox("Group By", options=['Sex', 'Pclass', 'Embarked', 'Deck', 'Title'])
+
+with col_method:
+    interval_method = st.radio("Interval Method", options=["Wilson", "Bootstrap"], horizontal=True)
+
+if filtered_df.empty:
+    st.write("No passengers match the current filters.")
+else:
+    survival_rate = filtered_df['Survived'].mean() * 100
+    lower, upper, overall_method = overall_survival_interval(filters, interval_method)
+    st.metric("Survival Rate", f"{survival_rate:.2f}%")
+    st.caption(f"95% CI ({overall_method}): {lower * 100:.2f}% – {upper * 100:.2f}%, "
+               f"{filtered_df.shape[0]} passengers")
+
+    interval_df = survival_intervals(filters, interval_group, interval_method)
+    col_table, col_chart = st.columns(2)
+
+    with col_table:
+        st.dataframe(
+            interval_df.style.format({'Survival_Rate': "{:.1%}", 'Lower': "{:.1%}", 'Upper': "{:.1%}"}),
+            use_container_width=True,
+        )
+        if interval_method == "Bootstrap" and (interval_df['Method'] == "Wilson").any():
+            st.caption(f"Groups with fewer than {intervals.BOOTSTRAP_MIN_ROWS} passengers, or where everyone "
+                       "or nobody survived, use the Wilson interval (Method column).")
+
+    with col_chart:
+        chart = charts.interval_chart(interval_df, interval_group, title=f"Survival Rate by {interval_group} (95% CI)")
+        st.altair_chart(chart, use_container_width=True)
+
+st.markdown("---")
+
 st.header("Survival Rate Based on Filters")
 
 plots = [
@@ -108,129 +177,52 @@ plots = [
 ]
 
 def create_survival_rate_plot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.countplot(x='Survived', data=data, palette="viridis", ax=ax)
-    ax.set_xlabel("Survived (0 = No, 1 = Yes)")
-    ax.set_ylabel("Count")
-    ax.set_title("Overall Survival Rate")
-    for p in ax.patches:
-        height = p.get_height()
-        ax.text(p.get_x() + p.get_width() / 2., height + 3, int(height), ha="center")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.count_chart(data, 'Survived', title="Overall Survival Rate", x_title="Survived (0 = No, 1 = Yes)")
+    st.altair_chart(chart, use_container_width=True)
 
 def create_survival_by_sex_plot(data, selected_sex):
     if selected_sex == "All":
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.countplot(x='Sex', hue='Survived', data=data, palette="viridis", ax=ax)
-        ax.set_title("Survival Rate by Sex")
-        ax.set_xlabel("Sex")
-        ax.set_ylabel("Count")
-        ax.legend(title='Survived', labels=['No', 'Yes'])
-        for p in ax.patches:
-            height = p.get_height()
-            ax.text(p.get_x() + p.get_width() / 2., height + 3, int(height), ha="center")
-        plt.tight_layout()
-        st.pyplot(fig)
+        chart = charts.count_chart(data, 'Sex', hue='Survived', title="Survival Rate by Sex", x_title="Sex")
+        st.altair_chart(chart, use_container_width=True)
 
 def create_survival_by_pclass_plot(data, selected_pclass):
     if selected_pclass == "All":
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.countplot(x='Pclass', hue='Survived', data=data, palette="viridis", ax=ax)
-        ax.set_title("Survival Rate by Passenger Class")
-        ax.set_xlabel("Passenger Class")
-        ax.set_ylabel("Count")
-        ax.legend(title='Survived', labels=['No', 'Yes'])
-        for p in ax.patches:
-            height = p.get_height()
-            ax.text(p.get_x() + p.get_width() / 2., height + 3, int(height), ha="center")
-        plt.tight_layout()
-        st.pyplot(fig)
+        chart = charts.count_chart(data, 'Pclass', hue='Survived', title="Survival Rate by Passenger Class", x_title="Passenger Class")
+        st.altair_chart(chart, use_container_width=True)
 
 def create_age_distribution_plot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.histplot(data['Age'].dropna(), bins=30, kde=True, color="skyblue", ax=ax)
-    ax.set_title("Age Distribution of Passengers")
-    ax.set_xlabel("Age")
-    ax.set_ylabel("Count")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.histogram_chart(data['Age'], title="Age Distribution of Passengers", x_title="Age")
+    st.altair_chart(chart, use_container_width=True)
 
 def create_fare_distribution_plot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.boxplot(x='Pclass', y='Fare', data=data, palette="viridis", ax=ax)
-    ax.set_title("Fare Distribution by Passenger Class")
-    ax.set_xlabel("Passenger Class")
-    ax.set_ylabel("Fare")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.box_chart(data, 'Pclass', 'Fare', title="Fare Distribution by Passenger Class", x_title="Passenger Class")
+    st.altair_chart(chart, use_container_width=True)
 
 def create_family_size_distribution_plot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.countplot(x='Family_Size', data=data, palette="viridis", ax=ax)
-    ax.set_title("Family Size Distribution")
-    ax.set_xlabel("Family Size")
-    ax.set_ylabel("Count")
-    for p in ax.patches:
-        height = p.get_height()
-        ax.text(p.get_x() + p.get_width() / 2., height + 3, int(height), ha="center")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.count_chart(data, 'Family_Size', title="Family Size Distribution", x_title="Family Size")
+    st.altair_chart(chart, use_container_width=True)
 
 def create_fare_vs_age_plot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.scatterplot(x='Age', y='Fare', hue='Survived', data=data, palette="viridis", ax=ax)
-    ax.set_title("Fare vs. Age by Survival")
-    ax.set_xlabel("Age")
-    ax.set_ylabel("Fare")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.scatter_chart(data, 'Age', 'Fare', 'Survived', title="Fare vs. Age by Survival")
+    st.altair_chart(chart, use_container_width=True)
 
 def create_age_boxplot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.boxplot(x='Survived', y='Age', data=data, palette="viridis", ax=ax)
-    ax.set_title("Age Distribution by Survival")
-    ax.set_xlabel("Survived")
-    ax.set_ylabel("Age")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.box_chart(data, 'Survived', 'Age', title="Age Distribution by Survival", x_title="Survived")
+    st.altair_chart(chart, use_container_width=True)
 
 def create_age_violinplot(data):
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.violinplot(x='Pclass', y='Age', data=data, palette="viridis", ax=ax)
-    ax.set_title("Age Distribution by Passenger Class")
-    ax.set_xlabel("Passenger Class")
-    ax.set_ylabel("Age")
-    plt.tight_layout()
-    st.pyplot(fig)
+    chart = charts.violin_chart(data, 'Pclass', 'Age', title="Age Distribution by Passenger Class", x_title="Passenger Class")
+    st.altair_chart(chart)
 
 def create_survival_by_deck_plot(data):
     if 'Deck' in data.columns and data['Deck'].nunique() > 1:
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.countplot(x='Deck', hue='Survived', data=data, palette="viridis", ax=ax)
-        ax.set_title("Survival Rate by Deck")
-        ax.set_xlabel("Deck")
-        ax.set_ylabel("Count")
-        ax.legend(title='Survived', labels=['No', 'Yes'])
-        for p in ax.patches:
-            height = p.get_height()
-            ax.text(p.get_x() + p.get_width() / 2., height + 3, int(height), ha="center")
-        plt.tight_layout()
-        st.pyplot(fig)
+        chart = charts.count_chart(data, 'Deck', hue='Survived', title="Survival Rate by Deck", x_title="Deck")
+        st.altair_chart(chart, use_container_width=True)
 
 def create_title_distribution_plot(data):
     if 'Title' in data.columns and data['Title'].nunique() > 1:
-        title_counts = data['Title'].value_counts()
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.barplot(x=title_counts.index, y=title_counts.values, palette="viridis", ax=ax)
-        ax.set_title("Title Distribution")
-        ax.set_xlabel("Title")
-        ax.set_ylabel("Count")
-        for p in ax.patches:
-            height = p.get_height()
-            ax.text(p.get_x() + p.get_width() / 2., height + 3, int(height), ha="center")
-        plt.tight_layout()
-        st.pyplot(fig)
+        chart = charts.count_chart(data, 'Title', title="Title Distribution", x_title="Title", sort='-y')
+        st.altair_chart(chart, use_container_width=True)
 
 plot_list = [
     ("Overall Survival Rate", lambda: create_survival_rate_plot(filtered_df)),
@@ -6,6 +6,8 @@ import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
 
+import imputation
+
 st.set_page_config(page_title="Data Cleaning and Transformation", layout="wide")
 
 @st.cache_data
@@ -13,6 +15,10 @@ def load_data():
     data = pd.read_csv("data.csv")
     return data
 
+@st.cache_data
+def fit_imputation(data):
+    return imputation.fit_imputer(data)
+
 df_original = load_data()
 df = df_original.copy()
 
@@ -45,17 +51,31 @@ st.subheader("Handling Missing Values")
 with st.expander("View Missing Values Handling Instructions"):
     st.write("""
         **Steps Taken to Handle Missing Values:**
-        1. **Age:** Filled missing values with the median age.
-        2. **Embarked:** Filled missing values with the mode (most frequent value).
+        1. **Age:** Filled missing values with the median age of passengers sharing the same title (Mr, Mrs, Miss, Master, ...) and passenger class.
+        2. **Embarked:** Filled missing values with the mode (most frequent value) of passengers in the same passenger class and fare band (fare quartile).
+        3. Groups with no observed values fall back to the overall median / mode.
     """)
 
-age_median = df['Age'].median()
-df['Age'].fillna(age_median, inplace=True)
-st.success(f"Filled missing 'Age' values with median: {age_median}")
+imputation_params = fit_imputation(df_original)
+
+age_missing = df['Age'].isnull().sum()
+embarked_missing = df['Embarked'].isnull().sum()
+df = imputation.apply_imputation(df, imputation_params)
+
+st.success(f"Filled {age_missing} missing 'Age' values with the median by Title and Pclass "
+           f"(overall median {imputation_params['columns']['Age']['fallback']})")
+st.success(f"Filled {embarked_missing} missing 'Embarked' values with the mode by Pclass and Fare band "
+           f"(overall mode {imputation_params['columns']['Embarked']['fallback']})")
+
+col_age, col_embarked = st.columns(2)
+
+with col_age:
+    st.markdown("**Median Age by Title and Passenger Class**")
+    st.dataframe(imputation.statistics_table(imputation_params, 'Age'), use_container_width=True, height=250)
 
-embarked_mode = df['Embarked'].mode()[0]
-df['Embarked'].fillna(embarked_mode, inplace=True)
-st.success(f"Filled missing 'Embarked' values with mode: {embarked_mode}")
+with col_embarked:
+    st.markdown("**Most Frequent Embarkation by Passenger Class and Fare Band**")
+    st.dataframe(imputation.statistics_table(imputation_params, 'Embarked'), use_container_width=True, height=250)
 
 st.markdown("---")
 
@@ -130,7 +150,8 @@ st.subheader("Saving the Cleaned Data")
 
 if st.button("Save Cleaned Data"):
     df.to_csv("titanic_cleaned.csv", index=False)
-    st.success("Cleaned data has been saved as 'titanic_cleaned.csv'.")
+    imputation.save_params(imputation_params)
+    st.success(f"Cleaned data has been saved as 'titanic_cleaned.csv' and imputation statistics as '{imputation.PARAMS_PATH}'.")
 
 st.markdown("### Download Cleaned Data")
 def convert_df(df):
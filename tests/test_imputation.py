@@ -0,0 +1,39 @@
+# tests/test_imputation.py
+
+import numpy as np
+import pandas as pd
+
+import imputation
+
+
+def _training():
+    return pd.DataFrame({
+        'Name': ["A, Mr. X", "B, Mr. Y", "C, Miss. Z", "D, Capt. W", "E, Col. V"],
+        'Pclass': [3, 3, 3, 1, 1],
+        'Fare': [7.0, 8.0, 9.0, 70.0, 80.0],
+        'Age': [20.0, 30.0, 18.0, 70.0, 58.0],
+        'Embarked': ['S', 'S', 'Q', 'C', 'C'],
+    })
+
+
+def _batch(title_dtype):
+    return pd.DataFrame({
+        'Title': pd.Series([np.nan, 'Mr', 'Miss'], dtype=title_dtype),
+        'Pclass': [1, 3, 3],
+        'Fare': [75.0, 7.5, 8.5],
+        'Age': [np.nan, np.nan, np.nan],
+        'Embarked': [np.nan, 'S', 'S'],
+    }, index=[10, 11, 12])
+
+
+def test_apply_keeps_rows_with_unseen_and_nan_keys():
+    params = imputation.fit_imputer(_training())
+    for title_dtype in ('category', object):
+        batch = _batch(title_dtype)
+        filled = imputation.apply_imputation(batch, params)
+
+        assert filled.index.tolist() == [10, 11, 12]
+        # The untitled row falls back to the overall median instead of matching
+        # the fitted Capt/Col rows that are missing from the batch's categories.
+        assert filled['Age'].tolist() == [30.0, 25.0, 18.0]
+        assert filled['Embarked'].notna().all()